@@ -0,0 +1,9 @@
+# Gunicorn configuration, run with: gunicorn -c gunicorn.conf.py webhook:app
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# gevent workers patch blocking sockets so outbound calls to Tableau and Slack yield
+worker_class = 'gevent'
+workers = int(os.getenv('GUNICORN_WORKERS', 2))
+worker_connections = 1000
@@ -1,26 +1,115 @@
 import os
+import atexit
+import base64
+import functools
+import hashlib
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import re
+import threading
+import time
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 import logging
+import logging.handlers
+import orjson
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree as ET
+from xml.sax.saxutils import quoteattr
 
-app = Flask(__name__)
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+class OrjsonProvider(JSONProvider):
+    """ JSON provider backed by orjson for request parsing and jsonify """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Tableau event payloads are small, reject oversized bodies before they are read
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024
+
+# Set up logging, records are written to stderr by a background listener thread
+_LOG_QUEUE = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logging.getLogger().setLevel(logging.INFO)
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _log_stream_handler)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
 
 # Slack webhook URL
 SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
 SLACK_CHANNEL = os.getenv('SLACK_CHANNEL')
 SLACK_COLOR = os.getenv('SLACK_COLOR', '#C70039')
 
+# Optional secret used to verify the X-Tableau-Signature header on incoming webhooks
+TABLEAU_WEBHOOK_SECRET = os.getenv('TABLEAU_WEBHOOK_SECRET', '').encode('utf-8')
+
 # Tableau API URL and token
 TABLEAU_SERVER = os.getenv('TABLEAU_SERVER')
 TABLEAU_USERNAME = os.getenv('TABLEAU_USERNAME', )
 TABLEAU_PASSWORD = os.getenv('TABLEAU_PASSWORD', '')
 TABLEAU_SITE_ID = os.getenv('TABLEAU_SITE_ID')
-VERSION = float(os.getenv('TABLEAU_VERSION', 3.21))  # Ensure VERSION is a float
-XMLNS = {'t': 'http://tableau.com/api'}
+TABLEAU_WORKER_THREADS = os.getenv('TABLEAU_WORKER_THREADS', '8').strip()
+VERSION = os.getenv('TABLEAU_VERSION', '3.21').strip()  # Kept as a string so '3.20' is not turned into '3.2'
+
+# Namespace-qualified tags and search paths, resolved once instead of on every find
+_TAG_WEBHOOK = '{http://tableau.com/api}webhook'
+_TAG_ERROR = '{http://tableau.com/api}error'
+_TAG_CREDS = '{http://tableau.com/api}credentials'
+_PATH_SUMMARY = './/{http://tableau.com/api}summary'
+_PATH_DETAIL = './/{http://tableau.com/api}detail'
+_PATH_SITE = './/{http://tableau.com/api}site'
+_PATH_DEST_HTTP = './/{http://tableau.com/api}webhook-destination-http'
+
+# Tableau responses never need entities or network access, refuse them when parsing
+_XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True)
+XML_CONTENT_TYPES = ('application/xml', 'text/xml')
+MAX_ERROR_BODY_BYTES = 1 << 20
+
+# Request body for sign in, values are filled in with quoteattr
+_SIGNIN_TMPL = ('<tsRequest><credentials personalAccessTokenName={user} personalAccessTokenSecret={pw}>'
+                '<site contentUrl={site}/></credentials></tsRequest>')
+
+# Request body for webhook creation, values are filled in with quoteattr
+_WEBHOOK_TMPL = ('<tsRequest><webhook name={name} event={event}>'
+                 '<webhook-destination><webhook-destination-http method="POST" url={url}/>'
+                 '</webhook-destination></webhook></tsRequest>')
+
+# Shared HTTP session so connections to Tableau and Slack are kept alive and reused
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) seconds
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                                         raise_on_status=False))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Alerts are queued and posted to Slack in batches by a background worker
+SLACK_MAX_BATCH = 20
+SLACK_MAX_WAIT_SECONDS = 0.1
+SLACK_QUEUE_MAX_SIZE = 10000
+SLACK_DRAIN_TIMEOUT_SECONDS = 5
+SLACK_QUEUE = queue.Queue(maxsize=SLACK_QUEUE_MAX_SIZE)
+SLACK_TIMEOUT = (2, 5)  # (connect, read) seconds
+_SLACK_HEADERS = {'Content-Type': 'application/json'}
+
+DESTINATION_PROBE_TIMEOUT = 3  # seconds, for the HEAD request to a new webhook destination
+
+# Superseded tokens are signed out after this delay so requests still using them can finish
+SIGN_OUT_GRACE_SECONDS = 60
+
+# Tableau auth tokens expire after 240 minutes, refresh well before that
+AUTH_TTL_SECONDS = 200 * 60
 
 # Check if SLACK_WEBHOOK_URL and Tableau variables are set
 if not all([SLACK_WEBHOOK_URL, SLACK_CHANNEL]):
@@ -32,8 +121,35 @@ if not all([TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD]):
     raise RuntimeError(
         "Tableau environment variables (TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD) are required")
 
+if not re.fullmatch(r'\d+\.\d+', VERSION):
+    logging.error("Tableau API version is invalid")
+    raise RuntimeError(f"TABLEAU_VERSION must look like '3.21', got '{VERSION}'")
+
+if not TABLEAU_WORKER_THREADS.isdecimal() or int(TABLEAU_WORKER_THREADS) < 1:
+    logging.error("Tableau worker thread count is invalid")
+    raise RuntimeError(f"TABLEAU_WORKER_THREADS must be a positive integer, got '{TABLEAU_WORKER_THREADS}'")
+
+# Shared thread pool for Tableau calls that overlap or run in the background,
+# its size also caps how many of these calls run against Tableau at once
+_EXEC = ThreadPoolExecutor(max_workers=int(TABLEAU_WORKER_THREADS),
+                           thread_name_prefix='tableau-io')
+atexit.register(_EXEC.shutdown, wait=False)
+
+# Tableau REST API paths, built once since the server and version are fixed at startup
+_API_PREFIX = f"{TABLEAU_SERVER}/api/{VERSION}"
+_SIGNIN_PATH = f"/api/{VERSION}/auth/signin"
+_SIGNOUT_PATH = f"/api/{VERSION}/auth/signout"
+
+
+def _site_url(site_id, suffix):
+    """
+    Returns the Tableau REST API URL for a resource on the given site.
+    """
+    return f"{_API_PREFIX}/sites/{site_id}/{suffix}"
+
+
 # List of valid Tableau events
-VALID_TABLEAU_EVENTS = [
+VALID_TABLEAU_EVENTS = frozenset({
     'AdminPromoted',
     'AdminDemoted',
     'DatasourceUpdated',
@@ -56,7 +172,7 @@ VALID_TABLEAU_EVENTS = [
     'WorkbookRefreshStarted',
     'WorkbookRefreshSucceeded',
     'WorkbookRefreshFailed',
-]
+})
 
 
 class ApiCallError(Exception):
@@ -64,44 +180,94 @@ class ApiCallError(Exception):
     pass
 
 
+class TableauAuthError(ApiCallError):
+    """ TableauAuthError, 'auth_token' is the token that was rejected """
+
+    def __init__(self, message, auth_token=None):
+        super().__init__(message)
+        self.auth_token = auth_token
+
+
 class UserDefinedFieldError(Exception):
     """ UserDefinedFieldError """
     pass
 
 
-def _encode_for_display(text):
+# Cached Tableau credentials shared across requests
+_AUTH_CACHE = {'token': None, 'site_id': None, 'expires': 0}
+_AUTH_LOCK = threading.Lock()
+
+
+def _read_error_body(server_response):
     """
-    Encodes strings so they can display as ASCII in a Windows terminal window.
-    This function also encodes strings for processing by xml.etree.ElementTree functions.
+    Reads an error response body without loading more than MAX_ERROR_BODY_BYTES,
+    so streamed responses are not pulled into memory in full.
 
-    Returns an ASCII-encoded version of the text.
-    Unicode characters are converted to ASCII placeholders (for example, "?").
+    'server_response'       the response received from the server
+    Returns the body, or None if it is larger than MAX_ERROR_BODY_BYTES.
     """
-    return text.encode('ascii', errors="backslashreplace").decode('utf-8')
+    content_length = server_response.headers.get('Content-Length', '')
+    if content_length.isdecimal() and int(content_length) > MAX_ERROR_BODY_BYTES:
+        return None
 
+    body = bytearray()
+    for chunk in server_response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > MAX_ERROR_BODY_BYTES:
+            return None
+    return bytes(body)
 
-def _check_status(server_response, success_code):
+
+def _check_status(server_response, success_code, auth_token=None):
     """
     Checks the server response for possible errors.
 
     'server_response'       the response received from the server
     'success_code'          the expected success code for the response
+    'auth_token'            the token the request was made with, if any
     Throws an ApiCallError exception if the API call fails.
     """
     if server_response.status_code != success_code:
-        parsed_response = ET.fromstring(server_response.text)
+        if server_response.status_code == 401:
+            error_class = functools.partial(TableauAuthError, auth_token=auth_token)
+        else:
+            error_class = ApiCallError
+
+        # Proxies and load balancers may answer with HTML or plain text instead of Tableau XML
+        if not server_response.headers.get('Content-Type', '').startswith(XML_CONTENT_TYPES):
+            snippet = next(server_response.iter_content(chunk_size=512), b'')[:512]
+            raise error_class('{0}: {1}'.format(server_response.status_code,
+                                                snippet.decode('utf-8', errors='replace')))
+
+        body = _read_error_body(server_response)
+        if body is None:
+            raise error_class('{0}: error response too large to parse'.format(server_response.status_code))
+
+        parsed_response = ET.fromstring(body, _XML_PARSER)
 
         # Obtain the 3 xml tags from the response: error, summary, and detail tags
-        error_element = parsed_response.find('t:error', namespaces=XMLNS)
-        summary_element = parsed_response.find('.//t:summary', namespaces=XMLNS)
-        detail_element = parsed_response.find('.//t:detail', namespaces=XMLNS)
+        error_element = parsed_response.find(_TAG_ERROR)
+        summary_element = parsed_response.find(_PATH_SUMMARY)
+        detail_element = parsed_response.find(_PATH_DETAIL)
 
         # Retrieve the error code, summary, and detail if the response contains them
         code = error_element.get('code', 'unknown') if error_element is not None else 'unknown code'
         summary = summary_element.text if summary_element is not None else 'unknown summary'
         detail = detail_element.text if detail_element is not None else 'unknown detail'
         error_message = '{0}: {1} - {2}'.format(code, summary, detail)
-        raise ApiCallError(error_message)
+        raise error_class(error_message)
+    return
+
+
+def _check_auth(server_response, auth_token):
+    """
+    Raises a TableauAuthError if the server rejected the authentication token.
+
+    'server_response'       the response received from the server
+    'auth_token'            the token the request was made with
+    """
+    if server_response.status_code == 401:
+        raise TableauAuthError(server_response.text, auth_token)
     return
 
 
@@ -118,29 +284,23 @@ def sign_in(server, username, password, site):
                default is "", which signs in to the default site.
     Returns the authentication token and the site ID.
     """
-    url = server + "/api/{0}/auth/signin".format(VERSION)
+    url = server + _SIGNIN_PATH
 
     # Builds the request
-    xml_request = ET.Element('tsRequest')
-    credentials_element = ET.SubElement(xml_request, 'credentials', personalAccessTokenName=username,
-                                        personalAccessTokenSecret=password)
-    ET.SubElement(credentials_element, 'site', contentUrl=site)
-    xml_request = ET.tostring(xml_request)
+    xml_request = _SIGNIN_TMPL.format(user=quoteattr(username), pw=quoteattr(password),
+                                      site=quoteattr(site)).encode('utf-8')
 
     # Make the request to server
-    server_response = requests.post(url, data=xml_request)
+    server_response = SESSION.post(url, data=xml_request, timeout=REQUEST_TIMEOUT)
     _check_status(server_response, 200)
 
-    # ASCII encode server response to enable displaying to console
-    server_response = _encode_for_display(server_response.text)
-
     # Reads and parses the response
-    parsed_response = ET.fromstring(server_response)
+    parsed_response = ET.fromstring(server_response.content, _XML_PARSER)
 
     # Gets the auth token and site ID
-    token = parsed_response.find('t:credentials', namespaces=XMLNS).get('token')
-    site_id = parsed_response.find('.//t:site', namespaces=XMLNS).get('id')
-    # user_id = parsed_response.find('.//t:user', namespaces=XMLNS).get('id')
+    token = parsed_response.find(_TAG_CREDS).get('token')
+    site_id = parsed_response.find(_PATH_SITE).get('id')
+    # user_id = parsed_response.find('.//{http://tableau.com/api}user').get('id')
     return token, site_id
 
 
@@ -151,58 +311,223 @@ def sign_out(server, auth_token):
     'server'        specified server address
     'auth_token'    authentication token that grants user access to API calls
     """
-    url = server + "/api/{0}/auth/signout".format(VERSION)
-    server_response = requests.post(url, headers={'x-tableau-auth': auth_token})
-    _check_status(server_response, 204)
+    url = server + _SIGNOUT_PATH
+    server_response = SESSION.post(url, headers={'x-tableau-auth': auth_token}, timeout=REQUEST_TIMEOUT)
+    _check_status(server_response, 204, auth_token)
     return
 
 
+def get_auth():
+    """
+    Returns a cached authentication token and site ID, signing in again
+    once the cached token has expired.
+    """
+    with _AUTH_LOCK:
+        if _AUTH_CACHE['token'] and time.monotonic() < _AUTH_CACHE['expires']:
+            return _AUTH_CACHE['token'], _AUTH_CACHE['site_id']
+
+        token, site_id = sign_in(TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD, TABLEAU_SITE_ID)
+        expired_token = _AUTH_CACHE['token']
+        _AUTH_CACHE['token'] = token
+        _AUTH_CACHE['site_id'] = site_id
+        _AUTH_CACHE['expires'] = time.monotonic() + AUTH_TTL_SECONDS
+
+    # The superseded token is still valid on the server and may still be in use by
+    # requests that fetched it just before expiry, release it once they have finished
+    if expired_token:
+        timer = threading.Timer(SIGN_OUT_GRACE_SECONDS, sign_out_in_background, args=(expired_token,))
+        timer.daemon = True
+        timer.start()
+    return token, site_id
+
+
+def sign_out_in_background(auth_token):
+    """
+    Submits sign_out to the thread pool without waiting for it to finish.
+
+    'auth_token'    authentication token to invalidate
+    """
+    def _log_failure(future):
+        if future.exception() is not None:
+            logging.warning("Failed to sign out of Tableau: %s", future.exception())
+
+    _EXEC.submit(sign_out, TABLEAU_SERVER, auth_token).add_done_callback(_log_failure)
+
+
+def invalidate_auth(auth_token):
+    """
+    Clears the cached authentication token so the next call to get_auth signs in again.
+    Nothing is cleared if another request has already replaced the rejected token.
+
+    'auth_token'    the token Tableau rejected
+    """
+    with _AUTH_LOCK:
+        if auth_token is None or _AUTH_CACHE['token'] != auth_token:
+            return
+        _AUTH_CACHE['token'] = None
+        _AUTH_CACHE['site_id'] = None
+        _AUTH_CACHE['expires'] = 0
+
+
+def with_auth_retry(func):
+    """
+    Retries the wrapped view once with a fresh sign-in if Tableau rejects the cached token,
+    and returns a JSON failure if the fresh token is rejected as well.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except TableauAuthError as e:
+            logging.warning("Tableau auth token rejected, signing in again")
+            invalidate_auth(e.auth_token)
+            try:
+                return func(*args, **kwargs)
+            except TableauAuthError as e:
+                logging.error("Tableau auth token rejected after signing in again: %s", e)
+                return jsonify({'status': 'failure', 'error': str(e)}), 401
+    return wrapper
+
+
+def _post_to_slack(attachments):
+    """
+    Posts a single Slack message containing the given attachments.
+
+    'attachments'   list of Slack attachment dicts
+    """
+    slack_data = {
+        'channel': SLACK_CHANNEL,
+        'attachments': attachments
+    }
+    response = SESSION.post(SLACK_WEBHOOK_URL, data=orjson.dumps(slack_data), headers=_SLACK_HEADERS,
+                            timeout=SLACK_TIMEOUT)
+
+    if response.status_code == 200:
+        logging.info("%s alert(s) posted to Slack successfully", len(attachments))
+    else:
+        logging.error("Failed to post data to Slack: %s", response.text)
+
+
+def _slack_worker():
+    """
+    Drains SLACK_QUEUE, coalescing up to SLACK_MAX_BATCH alerts received within
+    SLACK_MAX_WAIT_SECONDS into a single Slack post.
+    """
+    while True:
+        attachments = [SLACK_QUEUE.get()]
+        deadline = time.monotonic() + SLACK_MAX_WAIT_SECONDS
+        while len(attachments) < SLACK_MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                attachments.append(SLACK_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _post_to_slack(attachments)
+        except Exception:
+            logging.exception("Failed to post data to Slack")
+        finally:
+            for _ in attachments:
+                SLACK_QUEUE.task_done()
+
+
+def _drain_slack_queue():
+    """
+    Waits up to SLACK_DRAIN_TIMEOUT_SECONDS at exit for queued alerts to be posted to Slack.
+    """
+    deadline = time.monotonic() + SLACK_DRAIN_TIMEOUT_SECONDS
+    while SLACK_QUEUE.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+    if SLACK_QUEUE.unfinished_tasks:
+        logging.warning("%s alert(s) not posted to Slack before exit", SLACK_QUEUE.unfinished_tasks)
+
+
+threading.Thread(target=_slack_worker, name='slack-worker', daemon=True).start()
+atexit.register(_drain_slack_queue)
+
+
+def _verify_signature(body, signature):
+    """
+    Checks the HMAC-SHA256 signature of a webhook request body.
+
+    'body'          raw request body
+    'signature'     base64-encoded signature from the X-Tableau-Signature header
+    Returns True if the signature matches the body.
+    """
+    if not signature:
+        return False
+    try:
+        expected = base64.b64decode(signature, validate=True)
+    except ValueError:
+        return False
+    mac = hmac.new(TABLEAU_WEBHOOK_SECRET, body, hashlib.sha256).digest()
+    return hmac.compare_digest(expected, mac)
+
+
+@app.errorhandler(413)
+def request_entity_too_large(error):
+    logging.error("Request body exceeds %s bytes", app.config['MAX_CONTENT_LENGTH'])
+    return jsonify({'status': 'failure', 'error': 'Request body too large'}), 413
+
+
 @app.route('/webhook', methods=['POST'])
 def webhook():
     if request.method == 'POST':
-        data = request.json
-        logging.info(f"Received data: {data}")
+        if not request.is_json:
+            logging.error("Webhook payload is not JSON")
+            return jsonify({'status': 'failure', 'error': 'Content-Type must be application/json'}), 415
+
+        # Read the body once for both signature verification and parsing
+        raw = request.get_data(cache=True)
+        if TABLEAU_WEBHOOK_SECRET and not _verify_signature(raw, request.headers.get('X-Tableau-Signature')):
+            logging.error("Invalid webhook signature")
+            return jsonify({'status': 'failure', 'error': 'Invalid signature'}), 401
+
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logging.error("Webhook payload is not valid JSON")
+            return jsonify({'status': 'failure', 'error': 'Invalid JSON payload'}), 400
+        logging.info("Received data: %s", data)
 
         # Extract necessary information
         event_type = data.get('event_type', 'Unknown Event')
         text = data.get('text', 'No additional information provided.')
         resource_name = data.get('resource_name', 'Unknown Resource')
 
-        # Post data to Slack with attachments
-        slack_data = {
-            'channel': SLACK_CHANNEL,
-            'attachments': [
+        # Queue the alert for the Slack worker
+        attachment = {
+            'fallback': f'{event_type} - {resource_name}',
+            'color': SLACK_COLOR,
+            'pretext': f'{event_type}:',
+            'fields': [
                 {
-                    'fallback': f'{event_type} - {resource_name}',
-                    'color': SLACK_COLOR,
-                    'pretext': f'{event_type}:',
-                    'fields': [
-                        {
-                            'title': resource_name,
-                            'value': text,
-                            'short': False
-                        }
-                    ]
+                    'title': resource_name,
+                    'value': text,
+                    'short': False
                 }
             ]
         }
-        response = requests.post(SLACK_WEBHOOK_URL, json=slack_data)
-
-        if response.status_code == 200:
-            logging.info("Alert posted to Slack successfully")
-            return jsonify({'status': 'success'}), 200
-        else:
-            logging.error(f"Failed to post data to Slack: {response.text}")
-            return jsonify({'status': 'failure', 'error': response.text}), 500
+        try:
+            SLACK_QUEUE.put_nowait(attachment)
+        except queue.Full:
+            # Let Tableau redeliver the alert later instead of dropping it
+            logging.error("Slack queue is full, rejecting alert")
+            return jsonify({'status': 'failure', 'error': 'Slack queue is full'}), 503
+        return jsonify({'status': 'success'}), 200
     else:
         return jsonify({'status': 'failure'}), 400
 
 
 @app.route('/create_tableau_webhook', methods=['POST'])
+@with_auth_retry
 def create_tableau_webhook():
     if request.method == 'POST':
         data = request.json
-        logging.info(f"Received data for Tableau webhook creation: {data}")
+        logging.info("Received data for Tableau webhook creation: %s", data)
 
         webhook_name = data.get('name')
         event_type = data.get('event')
@@ -226,57 +551,74 @@ def create_tableau_webhook():
         if not destination_url:
             logging.error("Destination URL is missing")
             return jsonify({'status': 'failure', 'error': 'Destination URL is required'}), 400
-        logging.info(f"Webhook name: {webhook_name}")
-        logging.info(f"Event type: {event_type}")
-        logging.info(f"Destination URL: {destination_url}")
+        logging.info("Webhook name: %s", webhook_name)
+        logging.info("Event type: %s", event_type)
+        logging.info("Destination URL: %s", destination_url)
+
+        # Sign in and check the destination URL is reachable concurrently
+        auth_future = _EXEC.submit(get_auth)
+        # The probe bypasses SESSION so it is not retried past its timeout
+        probe_future = _EXEC.submit(requests.head, destination_url, timeout=DESTINATION_PROBE_TIMEOUT)
+        token, site_id = auth_future.result()
+        probe_error = probe_future.exception()
+        if isinstance(probe_error, (requests.ConnectionError, requests.Timeout)):
+            logging.error("Destination URL is not reachable: %s", probe_error)
+            return jsonify({'status': 'failure', 'error': f'Destination URL is not reachable: {destination_url}'}), 400
+        if probe_error is not None:
+            logging.warning("Could not probe destination URL: %s", probe_error)
 
         # Create the XML payload
-        token, site_id = sign_in(TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD, TABLEAU_SITE_ID)
-        ts_request = ET.Element('tsRequest')
-        webhook_xml = ET.SubElement(ts_request, 'webhook', name=webhook_name, event=event_type)
-        webhook_destination = ET.SubElement(webhook_xml, 'webhook-destination')
-        ET.SubElement(webhook_destination, 'webhook-destination-http', method='POST', url=destination_url)
-        xml_payload = ET.tostring(ts_request, encoding='utf-8', method='xml')
-        logging.info(f"Calling tableau webhook api with payload: {xml_payload}")
-
-        tableau_url = f"{TABLEAU_SERVER}/api/{VERSION}/sites/{site_id}/webhooks"
+        xml_payload = _WEBHOOK_TMPL.format(name=quoteattr(webhook_name), event=quoteattr(event_type),
+                                           url=quoteattr(destination_url)).encode('utf-8')
+        logging.info("Calling tableau webhook api with payload: %s", xml_payload)
+
+        tableau_url = _site_url(site_id, "webhooks")
         headers = {
             'X-Tableau-Auth': token,
             'Content-Type': 'application/xml'
         }
-        response = requests.post(tableau_url, data=xml_payload, headers=headers)
+        response = SESSION.post(tableau_url, data=xml_payload, headers=headers, timeout=REQUEST_TIMEOUT)
+        _check_auth(response, token)
 
         if response.status_code == 201:
             logging.info("Tableau webhook created successfully")
             return jsonify({'status': 'success'}), 201
         else:
-            logging.error(f"Failed to create Tableau webhook: {response.text}")
+            logging.error("Failed to create Tableau webhook: %s", response.text)
             return jsonify({'status': 'failure', 'error': response.text}), 500
     else:
         return jsonify({'status': 'failure'}), 400
 
 
 @app.route('/list_tableau_webhooks', methods=['GET'])
+@with_auth_retry
 def list_tableau_webhooks():
-    token, site_id = sign_in(TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD, TABLEAU_SITE_ID)
-    url = TABLEAU_SERVER + f"/api/{VERSION}/sites/{site_id}/webhooks"
-    server_response = requests.get(url, headers={'x-tableau-auth': token})
-    _check_status(server_response, 200)
+    token, site_id = get_auth()
+    url = _site_url(site_id, "webhooks")
     webhooks_data = []
-    root = ET.fromstring(server_response.text)
-    for _webhook in root.findall('.//{http://tableau.com/api}webhook'):
-        webhook_data = {
-            'id': _webhook.get('id'),
-            'name': _webhook.get('name'),
-            'event': _webhook.get('event'),
-            'url': _webhook.find('.//{http://tableau.com/api}webhook-destination-http').get('url')
-        }
-        webhooks_data.append(webhook_data)
+    with SESSION.get(url, headers={'x-tableau-auth': token}, timeout=REQUEST_TIMEOUT, stream=True) as server_response:
+        _check_status(server_response, 200, token)
+
+        # Stream the response and discard each webhook element once it has been read
+        server_response.raw.decode_content = True
+        for _, _webhook in ET.iterparse(server_response.raw, events=('end',), tag=_TAG_WEBHOOK,
+                                        resolve_entities=False, no_network=True):
+            webhook_data = {
+                'id': _webhook.get('id'),
+                'name': _webhook.get('name'),
+                'event': _webhook.get('event'),
+                'url': _webhook.find(_PATH_DEST_HTTP).get('url')
+            }
+            webhooks_data.append(webhook_data)
+            _webhook.clear()
+            while _webhook.getprevious() is not None:
+                del _webhook.getparent()[0]
 
     return jsonify({'status': 'success', 'webhooks': webhooks_data}), 200
 
 
 @app.route('/delete_tableau_webhook', methods=['POST'])
+@with_auth_retry
 def delete_tableau_webhook():
     data = request.json
     webhook_id = data.get('webhook_id')
@@ -285,19 +627,20 @@ def delete_tableau_webhook():
         logging.error("Missing required parameters: site_id or webhook_id")
         return jsonify({'status': 'failure', 'error': 'Missing required parameters: site_id or webhook_id'}), 400
 
-    token, site_id = sign_in(TABLEAU_SERVER, TABLEAU_USERNAME, TABLEAU_PASSWORD, TABLEAU_SITE_ID)
-    tableau_url = f"{TABLEAU_SERVER}/api/{VERSION}/sites/{site_id}/webhooks/{webhook_id}"
+    token, site_id = get_auth()
+    tableau_url = _site_url(site_id, f"webhooks/{webhook_id}")
     headers = {
         'X-Tableau-Auth': token,
         'Content-Type': 'application/xml'
     }
-    response = requests.delete(tableau_url, headers=headers)
+    response = SESSION.delete(tableau_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    _check_auth(response, token)
 
     if response.status_code == 204:
         logging.info("Tableau webhook deleted successfully")
         return jsonify({'status': 'success'}), 204
     else:
-        logging.error(f"Failed to delete Tableau webhook: {response.text}")
+        logging.error("Failed to delete Tableau webhook: %s", response.text)
         return jsonify({'status': 'failure', 'error': response.text}), response.status_code
 
 